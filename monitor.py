@@ -1,32 +1,29 @@
+from __future__ import annotations
+
 import time
 import json
+import hashlib
 import os
 import sys
 import logging
 import argparse
 import shutil
+import shlex
+import struct
 import subprocess
 import datetime
+import queue
+import threading
 
-try:
-    import mss
-    from PIL import Image, ImageOps, ImageFilter
-    import pytesseract
-    import numpy as np
-except Exception:
-    print("Missing Python dependencies. Please run: python -m pip install -r requirements.txt")
-    raise
-
-try:
-    import win32gui
-except Exception:
-    win32gui = None
+# Tesseract's OpenMP threading is slower than a single thread on small images
+# like our crafting region. Must be set before tesseract is loaded/spawned.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+os.environ.setdefault("OMP_NUM_THREADS", "1")
 
-try:
-    from win10toast import ToastNotifier
-    toaster = ToastNotifier()
-except Exception:
-    toaster = None
+# Heavy third-party modules, bound by _lazy_imports() so that `--help` and
+# other startup paths don't pay for importing them
+mss = np = cv2 = None
+tesserocr = ahocorasick = win32gui = toaster = None
 
 import ctypes
 try:
@@ -36,12 +33,96 @@ except Exception:
 
 logging.basicConfig(level=logging.INFO, format="[%(asctime)s] %(message)s")
 
+# Tesseract variables applied to every OCR call. tessedit_do_invert=0 skips
+# the auto-invert pass, and the dictionary DAWGs are useless for item mod text.
+TESSERACT_VARIABLES = {
+    "tessedit_do_invert": "0",
+    "load_system_dawg": "0",
+    "load_freq_dawg": "0",
+}
+DEFAULT_TESSERACT_CONFIG = "--oem 1 --psm 6 " + " ".join(
+    f"-c {k}={v}" for k, v in TESSERACT_VARIABLES.items())
+
+# Tesseract binary used for command-line OCR; resolved by check_tesseract
+_tesseract_cmd = "tesseract"
+
+# 256-entry grayscale palette (B, G, R, reserved) for 8-bit BMP output
+_BMP_GRAY_PALETTE = bytes(c for i in range(256) for c in (i, i, i, 0))
+
+# Below this many desired outcomes plain substring checks beat the automaton
+AHO_CORASICK_MIN_PATTERNS = 5
+
+# Without pyahocorasick, this many desired outcomes make the numba scanner worth it
+NUMBA_MIN_PATTERNS = 32
+
+# hwnd of the window last matched by find_window_rect
+_cached_hwnd = None
+
+# Folder next to monitor.py holding the fast LSTM models, used when present
+DEFAULT_TESSDATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tessdata_fast")
+
+# Upscaling filters (cv2 flag names) selectable with the `resample` config key.
+# Screen text is already crisp, so the 4-tap cubic filter is as good as Lanczos
+# and cheaper.
+_RESAMPLE_MODES = {
+    "cubic": "INTER_CUBIC",
+    "lanczos": "INTER_LANCZOS4",
+}
+
+# Thresholding modes accepted by the `binarize` config key
+_BINARIZE_MODES = ("otsu", "adaptive", "none")
+
+# 3x3 sharpen kernel applied after upscaling in preprocess_for_ocr; built by
+# _lazy_imports once numpy is loaded
+_SHARPEN_KERNEL = None
+
+
+def _lazy_imports():
+    """Import the capture/OCR dependencies on first use."""
+    global mss, np, cv2, tesserocr, ahocorasick, win32gui, toaster, _SHARPEN_KERNEL
+    if np is not None:
+        return
+
+    try:
+        import mss
+        import numpy as np
+        import cv2
+    except Exception:
+        print("Missing Python dependencies. Please run: python -m pip install -r requirements.txt")
+        raise
+
+    try:
+        import tesserocr
+    except Exception:
+        tesserocr = None
+
+    try:
+        import ahocorasick
+    except Exception:
+        ahocorasick = None
+
+    try:
+        import win32gui
+    except Exception:
+        win32gui = None
+
+    try:
+        from win10toast import ToastNotifier
+        toaster = ToastNotifier()
+    except Exception:
+        toaster = None
+
+    _SHARPEN_KERNEL = np.array([[0, -1, 0], [-1, 5, -1], [0, -1, 0]], dtype=np.float32)
+
 
 def load_config(path="config.json"):
     if not os.path.exists(path):
         raise FileNotFoundError(f"Config file not found: {path}")
     with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+        cfg = json.load(f)
+    if "tessdata_dir" not in cfg and os.path.isdir(DEFAULT_TESSDATA_DIR):
+        cfg["tessdata_dir"] = DEFAULT_TESSDATA_DIR
+    return cfg
 
 
 def check_python_version():
@@ -50,20 +131,21 @@ def check_python_version():
 
 
 def check_tesseract(cfg):
+    global _tesseract_cmd
     cmd = cfg.get("tesseract_cmd")
     if cmd:
         if not os.path.exists(cmd):
             logging.warning("Configured tesseract_cmd does not exist: %s", cmd)
         else:
             logging.info("Using tesseract binary: %s", cmd)
-            pytesseract.pytesseract.tesseract_cmd = cmd
+            _tesseract_cmd = cmd
             return True
 
     # Try discovering tesseract on PATH
     found = shutil.which("tesseract")
     if found:
         logging.info("Found tesseract on PATH: %s", found)
-        pytesseract.pytesseract.tesseract_cmd = found
+        _tesseract_cmd = found
         return True
 
     # Try running `tesseract -v` to be sure
@@ -79,53 +161,308 @@ def check_tesseract(cfg):
     return False
 
 
+def _title_matches(hwnd, title_substring):
+    if not win32gui.IsWindowVisible(hwnd):
+        return False
+    title = win32gui.GetWindowText(hwnd)
+    return bool(title) and title_substring.lower() in title.lower()
+
+
 def find_window_rect(title_substring: str):
+    global _cached_hwnd
     if not win32gui:
         return None
 
+    # Re-check the window found last time before falling back to a full scan
+    hwnd = _cached_hwnd
+    if hwnd is not None:
+        try:
+            if win32gui.IsWindow(hwnd) and _title_matches(hwnd, title_substring):
+                left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+                return {"left": left, "top": top, "width": right - left, "height": bottom - top}
+        except Exception:
+            pass
+        _cached_hwnd = None
+
     found = []
 
     def enum(hwnd, lparam):
-        if win32gui.IsWindowVisible(hwnd):
-            title = win32gui.GetWindowText(hwnd)
-            if title and title_substring.lower() in title.lower():
-                rect = win32gui.GetWindowRect(hwnd)
-                found.append(rect)
+        if _title_matches(hwnd, title_substring):
+            found.append(hwnd)
 
     win32gui.EnumWindows(enum, None)
     if found:
-        left, top, right, bottom = found[0]
+        _cached_hwnd = found[0]
+        left, top, right, bottom = win32gui.GetWindowRect(found[0])
         return {"left": left, "top": top, "width": right - left, "height": bottom - top}
     return None
 
 
-def capture_region(region):
-    with mss.mss() as sct:
-        shot = sct.grab(region)
-        # `shot.rgb` contains RGB bytes; create an RGB image directly
-        img = Image.frombytes("RGB", shot.size, shot.rgb)
-        return img
+def capture_region(sct, region):
+    """Grab `region` with the long-lived mss instance `sct`.
 
+    Returns the frame as an (h, w, 4) BGRA uint8 array that views the
+    screenshot's own buffer, so no pixels are copied. mss allocates a fresh
+    buffer per grab, so the view stays valid after the next capture.
+    """
+    shot = sct.grab(region)
+    w, h = shot.size
+    # OpenCV converts straight from BGRA, so there is no need for an RGB copy
+    return np.frombuffer(shot.raw, dtype=np.uint8).reshape(h, w, 4)
 
-def preprocess_for_ocr(img: Image.Image, scale=2):
-    gray = ImageOps.grayscale(img)
-    w, h = gray.size
-    gray = gray.resize((w * scale, h * scale), Image.LANCZOS)
-    gray = gray.filter(ImageFilter.SHARPEN)
+
+def crop_to_roi(frame: np.ndarray, roi):
+    """Return the `text_roi` sub-rectangle of `frame` as a view (no copy).
+
+    `roi` is relative to the captured region: {"left", "top", "width", "height"}.
+    It is clamped to the frame, so the result is empty (size 0) when the ROI
+    lies outside it, e.g. after the game window shrank.
+    """
+    frame_h, frame_w = frame.shape[:2]
+    left = int(roi.get("left", 0))
+    top = int(roi.get("top", 0))
+    right = left + int(roi.get("width", frame_w - left))
+    bottom = top + int(roi.get("height", frame_h - top))
+    # intersect with the frame rather than shifting the ROI inside it
+    left, right = min(max(left, 0), frame_w), min(max(right, 0), frame_w)
+    top, bottom = min(max(top, 0), frame_h), min(max(bottom, 0), frame_h)
+    return frame[top:max(bottom, top), left:max(right, left)]
+
+
+def frame_hash(frame: np.ndarray):
+    """Return a fingerprint of every pixel in the captured frame.
+
+    The whole frame is hashed so that a one-glyph change is never missed;
+    blake2b over a typical crafting region takes about a millisecond.
+    """
+    return hashlib.blake2b(np.ascontiguousarray(frame).data, digest_size=8).digest()
+
+
+def frame_thumbnail(frame: np.ndarray, size=32):
+    """Return a small grayscale thumbnail of the frame for change detection.
+
+    Area averaging smooths out anti-aliasing flicker. The result is int16 so
+    thumbnails can be subtracted without wrapping.
+    """
+    thumb = cv2.resize(frame, (size, size), interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(thumb, cv2.COLOR_BGRA2GRAY).astype(np.int16)
+
+
+def thumbnail_sad(thumb: np.ndarray, prev_thumb: np.ndarray):
+    """Sum of absolute differences between two thumbnails."""
+    return int(np.abs(thumb - prev_thumb).sum())
+
+
+def preprocess_for_ocr(frame: np.ndarray, scale=2, binarize="otsu", resample="cubic"):
+    """Grayscale, upscale, sharpen and binarize a BGRA frame.
+
+    `resample` is "cubic" or "lanczos". `binarize` is "otsu", "adaptive" (for
+    uneven backgrounds) or "none". Returns a single-channel uint8 array.
+    """
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGRA2GRAY)
+    if scale != 1:
+        h, w = gray.shape
+        interpolation = getattr(cv2, _RESAMPLE_MODES.get(resample, "INTER_CUBIC"))
+        gray = cv2.resize(gray, (w * scale, h * scale), interpolation=interpolation)
+    gray = cv2.filter2D(gray, -1, _SHARPEN_KERNEL)
+    if binarize == "otsu":
+        _, gray = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    elif binarize == "adaptive":
+        gray = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 10)
+    else:
+        return gray
+    # Tesseract expects dark text on a light page; game text is usually light
+    # on dark, so flip when the background came out black
+    if cv2.countNonZero(gray) < gray.size // 2:
+        gray = cv2.bitwise_not(gray)
     return gray
 
 
-def ocr_image(img: Image.Image, ocr_lang="eng", tesseract_cmd=None, tesseract_config='--psm 6'):
-    if tesseract_cmd:
-        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+def ocr_dpi(cfg):
+    """Resolution of the preprocessed image: ~96 DPI screen pixels times `scale`.
+
+    Both OCR paths report this value so Tesseract sees the same resolution.
+    """
+    return 96 * int(cfg.get("scale", 2))
+
+
+def create_tess_api(cfg):
+    """Open a persistent in-process tesserocr API.
+
+    Returns None when tesserocr is not installed or fails to initialise, in
+    which case OCR falls back to running the tesseract command line.
+    """
+    if not tesserocr:
+        return None
+    kwargs = {
+        "lang": cfg.get("ocr_lang", "eng"),
+        "psm": tesserocr.PSM.SINGLE_BLOCK,
+        "oem": tesserocr.OEM.LSTM_ONLY,
+        # passed at init time so the load_*_dawg variables take effect
+        "variables": dict(TESSERACT_VARIABLES),
+    }
+    if cfg.get("char_whitelist"):
+        kwargs["variables"]["tessedit_char_whitelist"] = cfg["char_whitelist"]
+    # Fixing the resolution here (see ocr_dpi) stops Tesseract estimating it
+    # for every SetImageBytes call.
+    kwargs["variables"]["user_defined_dpi"] = str(ocr_dpi(cfg))
+    if cfg.get("tessdata_dir"):
+        kwargs["path"] = cfg["tessdata_dir"]
+    try:
+        api = tesserocr.PyTessBaseAPI(**kwargs)
+    except Exception:
+        logging.exception("Failed to initialise tesserocr; falling back to the tesseract command line")
+        return None
+    logging.info("Using in-process tesserocr API")
+    return api
+
+
+def build_tesseract_args(cfg):
+    """Return the extra tesseract command-line arguments for `cfg`.
+
+    `tesseract_config` replaces the default options; `tessdata_dir` and
+    `char_whitelist` are always passed through.
+    """
+    args = []
+    tessdata_dir = cfg.get("tessdata_dir")
+    if tessdata_dir:
+        args += ["--tessdata-dir", tessdata_dir]
+    args += shlex.split(cfg.get("tesseract_config", DEFAULT_TESSERACT_CONFIG), posix=os.name != "nt")
+    whitelist = cfg.get("char_whitelist")
+    if whitelist:
+        # a separate argv entry, so spaces and quotes in the whitelist are safe
+        args += ["-c", f"tessedit_char_whitelist={whitelist}"]
+    return args
+
+
+def encode_bmp(gray: np.ndarray, dpi=96):
+    """Encode a 2-D uint8 array as an uncompressed 8-bit grayscale BMP.
+
+    Much cheaper than PNG since there is no deflate step. `dpi` is stored in
+    the header, which is where `tesseract stdin` reads the resolution from.
+    """
+    h, w = gray.shape
+    stride = (w + 3) & ~3  # BMP rows are padded to 4 bytes
+    if stride == w:
+        pixels = gray[::-1].tobytes()  # rows are stored bottom-up
+    else:
+        padded = np.zeros((h, stride), dtype=np.uint8)
+        padded[:, :w] = gray[::-1]
+        pixels = padded.tobytes()
+    offset = 14 + 40 + len(_BMP_GRAY_PALETTE)
+    file_header = struct.pack("<2sIHHI", b"BM", offset + len(pixels), 0, 0, offset)
+    ppm = round(dpi / 0.0254)  # BMP stores pixels per metre
+    info_header = struct.pack("<IiiHHIIiiII", 40, w, h, 1, 8, 0, len(pixels), ppm, ppm, 256, 0)
+    return file_header + info_header + _BMP_GRAY_PALETTE + pixels
+
+
+def run_tesseract(img: np.ndarray, ocr_lang="eng", tesseract_args=(), dpi=96):
+    """OCR `img` with the tesseract command line, piping a BMP over stdin."""
+    cmd = [_tesseract_cmd, "stdin", "stdout", "-l", ocr_lang, *tesseract_args]
+    # don't flash a console window for every poll on Windows
+    flags = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+    out = subprocess.run(cmd, input=encode_bmp(img, dpi=dpi), capture_output=True, creationflags=flags)
+    if out.returncode != 0:
+        raise RuntimeError(out.stderr.decode("utf-8", "replace").strip())
+    return out.stdout.decode("utf-8", "replace")
+
+
+def ocr_image(img: np.ndarray, api=None, ocr_lang="eng", tesseract_args=(), dpi=96):
+    """Return the OCR text for `img`, or None if Tesseract failed."""
+    if api is not None:
+        try:
+            h, w = img.shape
+            api.SetImageBytes(img.tobytes(), w, h, 1, w)
+            return api.GetUTF8Text()
+        except Exception:
+            logging.exception("tesserocr OCR failed")
+            return None
+
     try:
-        text = pytesseract.image_to_string(img, lang=ocr_lang, config=tesseract_config)
+        text = run_tesseract(img, ocr_lang=ocr_lang, tesseract_args=tesseract_args, dpi=dpi)
     except Exception:
         logging.exception("Tesseract OCR failed")
-        text = ""
+        text = None
     return text
     
 
+class ScreenshotWriter:
+    """Save debug screenshots as JPEG on a background thread.
+
+    The poll loop only queues the frame; encoding, printing the path
+    and appending to `saved_files.txt` all happen off the hot path. Index
+    writes are buffered and flushed every `flush_every` files or
+    `flush_interval` seconds.
+    """
+
+    def __init__(self, screenshot_dir, quality=85, flush_every=10, flush_interval=1.0):
+        self.screenshot_dir = screenshot_dir
+        self.quality = quality
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue(maxsize=8)
+        self.thread = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+        self.thread.start()
+
+    def submit(self, path, frame):
+        # no copy needed: each capture gets its own buffer from mss
+        try:
+            self.queue.put_nowait((path, frame))
+        except queue.Full:
+            logging.warning("Screenshot writer is falling behind; dropping %s", path)
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join(timeout=5.0)
+
+    def _run(self):
+        index_file = os.path.join(self.screenshot_dir, "saved_files.txt")
+        try:
+            index = open(index_file, "ab", buffering=64 * 1024)
+        except Exception:
+            logging.exception("Failed to open screenshot index: %s", index_file)
+            index = None
+        pending = 0
+        last_flush = time.time()
+        try:
+            while True:
+                try:
+                    item = self.queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    pass
+                else:
+                    if item is None:
+                        break
+                    path, frame = item
+                    if self._save(path, frame) and index:
+                        index.write((path + os.linesep).encode("utf-8"))
+                        pending += 1
+                now = time.time()
+                if index and pending and (pending >= self.flush_every or now - last_flush >= self.flush_interval):
+                    index.flush()
+                    pending = 0
+                    last_flush = now
+        finally:
+            if index:
+                index.close()
+
+    def _save(self, path, frame):
+        """Write one screenshot; returns True if the file was saved."""
+        try:
+            bgr = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+            if not cv2.imwrite(path, bgr, [cv2.IMWRITE_JPEG_QUALITY, self.quality]):
+                logging.error("Failed to save screenshot: %s", path)
+                return False
+        except Exception:
+            logging.exception("Failed to save screenshot")
+            return False
+        logging.info("Saved screenshot: %s", path)
+        # Also print the path for easy discovery
+        print(path)
+        sys.stdout.flush()
+        return True
+
+
 def notify(title, message):
     # Avoid win10toast threaded callbacks (can trigger WNDPROC conversion errors).
     try:
@@ -152,34 +489,142 @@ def notify(title, message):
         logging.exception("Beep failed")
 
 
-def matches_desired(text: str, desired_list):
+def lowercase_desired(desired_list):
+    """Return `(item, item.lower())` pairs for the non-empty desired items.
+
+    Done once at config load so matching only lowercases the OCR text.
+    """
+    return [(item, item.lower()) for item in desired_list if item]
+
+
+def build_automaton(desired_lc):
+    """Compile `desired_lc` pairs into an Aho-Corasick automaton for matches_desired.
+
+    Returns None when pyahocorasick is not installed or the list is short
+    enough that plain substring checks are faster.
+    """
+    if not ahocorasick or len(desired_lc) < AHO_CORASICK_MIN_PATTERNS:
+        return None
+    # several items can share a lowercase key ("Fire", "fire"); keep them all
+    # so every matcher path reports the same items
+    items_by_key = {}
+    for item, item_lc in desired_lc:
+        items_by_key.setdefault(item_lc, []).append(item)
+    automaton = ahocorasick.Automaton()
+    for item_lc, items in items_by_key.items():
+        automaton.add_word(item_lc, items)
+    automaton.make_automaton()
+    return automaton
+
+
+def _find_any(text, patterns):
+    """Return the indices of `patterns` that occur in `text` (all uint8 arrays)."""
+    found = []
+    n = text.shape[0]
+    for p in range(len(patterns)):
+        pat = patterns[p]
+        m = pat.shape[0]
+        first = pat[0]
+        for i in range(n - m + 1):
+            if text[i] != first:
+                continue
+            j = 1
+            while j < m and text[i + j] == pat[j]:
+                j += 1
+            if j == m:
+                found.append(p)
+                break
+    return found
+
+
+# numba-compiled _find_any; built on demand by build_numba_patterns
+find_any = None
+
+
+def build_numba_patterns(desired_lc):
+    """Encode `desired_lc` pairs as UTF-8 byte arrays for the numba scanner.
+
+    Returns None when numba is not installed or there are too few items for
+    the compiled scan to pay off.
+    """
+    global find_any
+    if len(desired_lc) < NUMBA_MIN_PATTERNS:
+        return None
+    # numba is slow to import, so only load it when the scanner is needed
+    try:
+        import numba
+    except Exception:
+        return None
+    if find_any is None:
+        find_any = numba.njit(cache=True)(_find_any)
+    patterns = numba.typed.List()
+    for _, item_lc in desired_lc:
+        patterns.append(np.frombuffer(item_lc.encode("utf-8"), dtype=np.uint8))
+    # compile now rather than on the first poll; matches_desired passes a
+    # read-only frombuffer array, so warm up that exact signature
+    find_any(np.frombuffer(b"", dtype=np.uint8), patterns)
+    return patterns
+
+
+def matches_desired(text: str, desired_lc, automaton=None, nb_patterns=None):
     """Return a list of desired items that were found in the OCR text.
 
-    Returns an empty list if no items matched.
+    `desired_lc` comes from lowercase_desired; the original-case items are
+    returned. With an `automaton` from build_automaton the text is scanned
+    once for all items; with `nb_patterns` from build_numba_patterns the scan
+    runs in compiled code. Returns an empty list if no items matched.
     """
     if not text:
         return []
     t = text.lower()
+    if automaton is not None:
+        found = {item for _, items in automaton.iter(t) for item in items}
+        return [item for item, _ in desired_lc if item in found]
+    if nb_patterns is not None:
+        t_bytes = np.frombuffer(t.encode("utf-8"), dtype=np.uint8)
+        return [desired_lc[i][0] for i in find_any(t_bytes, nb_patterns)]
     matches = []
-    for item in desired_list:
-        if item and item.lower() in t:
+    for item, item_lc in desired_lc:
+        if item_lc in t:
             matches.append(item)
     return matches
 
 
 def main(config_path, debug=False):
+    _lazy_imports()
     cfg = load_config(config_path)
     window_title = cfg.get("window_title_substring", "Path of Exile")
     region_cfg = cfg.get("monitor_region")
+    text_roi = cfg.get("text_roi")
     desired = cfg.get("desired_outcomes", [])
+    desired_lc = lowercase_desired(desired)
+    automaton = build_automaton(desired_lc)
+    nb_patterns = build_numba_patterns(desired_lc) if automaton is None else None
     poll = float(cfg.get("poll_interval", 0.8))
+    # Back off towards this interval while the screen stays unchanged
+    max_poll = max(float(cfg.get("max_poll_interval", 1.0)), poll)
     ocr_lang = cfg.get("ocr_lang", "eng")
-    tesseract_cmd = cfg.get("tesseract_cmd")
     scale = int(cfg.get("scale", 2))
+    dpi = ocr_dpi(cfg)
+    binarize = cfg.get("binarize", "otsu")
+    if binarize not in _BINARIZE_MODES:
+        logging.warning("Unknown binarize mode %r; using otsu", binarize)
+        binarize = "otsu"
+    resample = cfg.get("resample", "cubic")
+    if resample not in _RESAMPLE_MODES:
+        logging.warning("Unknown resample mode %r; using cubic", resample)
+        resample = "cubic"
     cooldown = float(cfg.get("alert_cooldown", 1.0))
+    tesseract_args = build_tesseract_args(cfg)
 
     last_alert = 0
     last_screenshot = 0
+    # OCR result cache keyed on the frame hash (or thumbnail when
+    # change_threshold is set); reused while the screen is static
+    change_threshold = float(cfg.get("change_threshold", 0))
+    last_key = None
+    last_text = ""
+    stable_streak = 0
 
     # Screenshot debug settings
     screenshot_interval = float(cfg.get("screenshot_interval", 0))
@@ -190,6 +635,7 @@ def main(config_path, debug=False):
             os.makedirs(screenshot_dir, exist_ok=True)
         except Exception:
             logging.exception("Failed to create screenshot directory: %s", screenshot_dir)
+    writer = ScreenshotWriter(screenshot_dir) if screenshot_interval else None
 
     if debug:
         logging.getLogger().setLevel(logging.DEBUG)
@@ -198,71 +644,105 @@ def main(config_path, debug=False):
     logging.info("Starting monitor for window containing: %s", window_title)
     logging.info("Desired outcomes: %s", desired)
 
-    while True:
-        region = None
-        if region_cfg:
-            region = region_cfg
-        else:
-            region = find_window_rect(window_title)
+    # Keep one mss instance (screen DC + bitmap) and one Tesseract engine
+    # alive for the whole session
+    sct = mss.mss()
+    api = create_tess_api(cfg)
+    if api is None:
+        # resolves the tesseract binary once for the session
+        check_tesseract(cfg)
+    try:
+        while True:
+            region = None
+            if region_cfg:
+                region = region_cfg
+            else:
+                region = find_window_rect(window_title)
 
-        if not region:
-            logging.warning("Could not find window or region. Make sure the game is running or set a fixed region in config.json.")
-            time.sleep(3.0)
-            continue
+            if not region:
+                logging.warning("Could not find window or region. Make sure the game is running or set a fixed region in config.json.")
+                time.sleep(3.0)
+                continue
 
-        try:
-            img = capture_region(region)
-        except Exception as e:
-            logging.exception("Capture failed: %s", e)
-            time.sleep(1.0)
-            continue
-
-        # Save periodic screenshots for debugging region selection
-        now = time.time()
-        if screenshot_interval and (now - last_screenshot) >= screenshot_interval:
             try:
-                ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
-                left = region.get("left", 0)
-                top = region.get("top", 0)
-                w = region.get("width", 0)
-                h = region.get("height", 0)
-                fname = f"screenshot_{ts}_L{left}_T{top}_W{w}_H{h}.png"
-                path = os.path.join(screenshot_dir, fname)
-                img.save(path)
-                logging.info("Saved screenshot: %s", path)
-                # Also print and append to an index file for easy discovery
-                try:
-                    print(path)
-                    sys.stdout.flush()
-                    index_file = os.path.join(screenshot_dir, "saved_files.txt")
-                    with open(index_file, "a", encoding="utf-8") as idx:
-                        idx.write(path + "\n")
-                except Exception:
-                    logging.exception("Failed to write screenshot index")
-            except Exception:
-                logging.exception("Failed to save screenshot")
-            last_screenshot = now
-
-        proc = preprocess_for_ocr(img, scale=scale)
-        tesseract_cfg = cfg.get("tesseract_config", f"--psm 6")
-        text = ocr_image(proc, ocr_lang=ocr_lang, tesseract_cmd=tesseract_cmd, tesseract_config=tesseract_cfg)
-
-        if debug:
-            logging.debug("OCR output:\n%s", text)
+                frame = capture_region(sct, region)
+                # Only the text ROI is hashed and OCR'd; screenshots keep the full region
+                ocr_frame = crop_to_roi(frame, text_roi) if text_roi else frame
+            except Exception as e:
+                logging.exception("Capture failed: %s", e)
+                time.sleep(1.0)
+                continue
 
-        matched = matches_desired(text, desired)
-        if matched:
+            # Save periodic screenshots for debugging region selection
             now = time.time()
-            if now - last_alert > cooldown:
-                logging.info("Desired outcome detected: %s", ", ".join(matched))
-                notify("PathOfOCR: Desired Craft", f"Detected: {', '.join(matched)}")
-                last_alert = now
+            if screenshot_interval and (now - last_screenshot) >= screenshot_interval:
+                try:
+                    ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
+                    left = region.get("left", 0)
+                    top = region.get("top", 0)
+                    w = region.get("width", 0)
+                    h = region.get("height", 0)
+                    fname = f"screenshot_{ts}_L{left}_T{top}_W{w}_H{h}.jpg"
+                    writer.submit(os.path.join(screenshot_dir, fname), frame)
+                except Exception:
+                    logging.exception("Failed to save screenshot")
+                last_screenshot = now
+
+            # checked after the screenshot block so a misplaced ROI can still be
+            # diagnosed from the full-region screenshots
+            if ocr_frame.size == 0:
+                logging.warning("text_roi %s lies outside the captured region; re-pick it with tools/region_picker.py --text-roi", text_roi)
+                time.sleep(3.0)
+                continue
+
+            if change_threshold > 0:
+                key = frame_thumbnail(ocr_frame)
+                unchanged = last_key is not None and thumbnail_sad(key, last_key) < change_threshold
             else:
-                logging.debug("Match found but still in cooldown: %s", ", ".join(matched))
-        else:
-            logging.debug("No desired text found")
+                key = frame_hash(ocr_frame)
+                unchanged = key == last_key
+            if unchanged:
+                text = last_text
+                logging.debug("Frame unchanged - reusing previous OCR result")
+            else:
+                proc = preprocess_for_ocr(ocr_frame, scale=scale, binarize=binarize, resample=resample)
+                text = ocr_image(proc, api=api, ocr_lang=ocr_lang, tesseract_args=tesseract_args, dpi=dpi)
+                if text is None:
+                    # don't cache a failure; retry OCR on the next poll
+                    text = ""
+                    last_key = None
+                else:
+                    last_key = key
+                    last_text = text
+
+                if debug:
+                    logging.debug("OCR output:\n%s", text)
+
+            matched = matches_desired(text, desired_lc, automaton, nb_patterns)
+            if matched:
+                now = time.time()
+                if now - last_alert > cooldown:
+                    logging.info("Desired outcome detected: %s", ", ".join(matched))
+                    notify("PathOfOCR: Desired Craft", f"Detected: {', '.join(matched)}")
+                    last_alert = now
+                else:
+                    logging.debug("Match found but still in cooldown: %s", ", ".join(matched))
+            else:
+                logging.debug("No desired text found")
 
-        time.sleep(poll)
+            # Double the sleep for each unchanged frame (capped); any change or
+            # match drops straight back to the base poll interval
+            if unchanged and not matched:
+                stable_streak += 1
+            else:
+                stable_streak = 0
+            time.sleep(min(poll * (1 << min(stable_streak, 4)), max_poll))
+    finally:
+        sct.close()
+        if api is not None:
+            api.End()
+        if writer:
+            writer.close()
 
 
 if __name__ == '__main__':
@@ -3,9 +3,13 @@
 Usage:
   python tools\list_windows.py            # prints coords to stdout
   python tools\region_picker.py --output config.json   # writes `monitor_region` into config.json
+  python tools\region_picker.py --text-roi --output config.json   # also writes `text_roi`
 
 Click-drag to select a rectangle. Press Esc to cancel. After releasing mouse, coordinates
 are printed as JSON: {"left":..., "top":..., "width":..., "height":...}
+
+With --text-roi a second drag selects the text area inside the first rectangle. It is
+printed and written as `text_roi`, relative to the top-left of `monitor_region`.
 """
 import json
 import argparse
@@ -15,8 +19,10 @@ import os
 
 
 class RegionPicker:
-    def __init__(self, write_path=None):
+    def __init__(self, write_path=None, pick_text_roi=False):
         self.write_path = write_path
+        self.pick_text_roi = pick_text_roi
+        self.region = None
         self.root = tk.Tk()
         self.root.attributes("-fullscreen", True)
         self.root.attributes("-topmost", True)
@@ -57,23 +63,63 @@ class RegionPicker:
         top = min(self.start_y, end_y)
         width = abs(end_x - self.start_x)
         height = abs(end_y - self.start_y)
-        region = {"left": int(left), "top": int(top), "width": int(width), "height": int(height)}
-        print(json.dumps(region))
-        sys.stdout.flush()
+        selection = {"left": int(left), "top": int(top), "width": int(width), "height": int(height)}
+
+        if self.region is None:
+            self.region = selection
+            print(json.dumps(selection))
+            sys.stdout.flush()
+            if self.pick_text_roi:
+                # keep the outer region on screen and start the second drag
+                self.canvas.itemconfigure(self.rect, outline='green')
+                self.rect = None
+                return
+            text_roi = None
+        else:
+            text_roi = self._relative_roi(selection)
+            if not text_roi["width"] or not text_roi["height"]:
+                # an empty ROI would leave the monitor nothing to OCR; let the user drag again
+                print("Text area must overlap the selected region; drag again or press Esc", file=sys.stderr)
+                self.canvas.delete(self.rect)
+                self.rect = None
+                return
+            print(json.dumps(text_roi))
+            sys.stdout.flush()
+
         if self.write_path:
             try:
-                self._write_to_config(region)
-                print(f"Wrote monitor_region to {self.write_path}")
+                self._write_to_config(self.region, text_roi)
+                written = "monitor_region and text_roi" if text_roi else "monitor_region"
+                print(f"Wrote {written} to {self.write_path}")
             except Exception as e:
                 print(f"Failed to write config: {e}", file=sys.stderr)
         self.root.destroy()
 
-    def _write_to_config(self, region):
+    def _relative_roi(self, selection):
+        # clamp the inner selection to the outer region and make it relative
+        outer = self.region
+        left = max(selection["left"], outer["left"])
+        top = max(selection["top"], outer["top"])
+        right = min(selection["left"] + selection["width"], outer["left"] + outer["width"])
+        bottom = min(selection["top"] + selection["height"], outer["top"] + outer["height"])
+        return {
+            "left": left - outer["left"],
+            "top": top - outer["top"],
+            "width": max(right - left, 0),
+            "height": max(bottom - top, 0),
+        }
+
+    def _write_to_config(self, region, text_roi=None):
         if not os.path.exists(self.write_path):
             raise FileNotFoundError(self.write_path)
         with open(self.write_path, 'r', encoding='utf-8') as f:
             cfg = json.load(f)
         cfg['monitor_region'] = region
+        # a text_roi is relative to the old region, so only keep a freshly picked one
+        if text_roi:
+            cfg['text_roi'] = text_roi
+        else:
+            cfg.pop('text_roi', None)
         # clear window_crop to avoid confusion when monitor_region is set
         cfg.pop('window_crop', None)
         with open(self.write_path, 'w', encoding='utf-8') as f:
@@ -90,8 +136,10 @@ class RegionPicker:
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('--output', '-o', help='Path to config.json to write monitor_region into')
+    parser.add_argument('--text-roi', '-t', action='store_true',
+                        help='After the region, select the text area inside it and write it as text_roi')
     args = parser.parse_args()
-    picker = RegionPicker(write_path=args.output)
+    picker = RegionPicker(write_path=args.output, pick_text_roi=args.text_roi)
     picker.run()
 
 